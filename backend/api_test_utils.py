@@ -0,0 +1,45 @@
+"""
+Shared helpers for the async API test scripts (test_all_endpoints.py and
+test_e2e_comprehensive.py): orjson request encoding, bearer headers and the
+opt-in cross-run token cache.
+"""
+
+import os
+import time
+import orjson
+
+# Cross-run token cache, keyed by base URL (opt-in with REUSE_TOKENS=1)
+REUSE_TOKENS = os.environ.get("REUSE_TOKENS") == "1"
+CACHE_TTL_SECONDS = 10 * 60
+
+def orjson_dumps(obj):
+    """aiohttp json_serialize hook: encode request bodies with orjson"""
+    return orjson.dumps(obj).decode()
+
+def bearer_headers(token):
+    """Authorization header dict for a JWT"""
+    return {"Authorization": "Bearer " + token}
+
+def _read_cache(path):
+    try:
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+def load_cache(path, base_url):
+    """Return base_url's entry from the cache file if it is younger than CACHE_TTL_SECONDS, else {}"""
+    entry = _read_cache(path).get(base_url, {})
+    if time.time() - entry.get("saved_at", 0) > CACHE_TTL_SECONDS:
+        return {}
+    return entry
+
+def save_cache(path, base_url, **data):
+    """Store data as base_url's entry, keeping other base URLs' entries"""
+    cache = _read_cache(path)
+    cache[base_url] = {"saved_at": time.time(), **data}
+    path.write_bytes(orjson.dumps(cache))
+
+async def token_is_valid(session, url, token):
+    """True if an authenticated GET to url answers 200"""
+    async with session.get(url, headers=bearer_headers(token)) as response:
+        return response.status == 200
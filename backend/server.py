@@ -1,5 +1,6 @@
-from fastapi import FastAPI, APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Depends, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 import os
@@ -7,13 +8,30 @@ import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional
+from contextlib import asynccontextmanager, AsyncExitStack
+from concurrent.futures import ThreadPoolExecutor
 import uuid
+import time
+from collections import deque
+import asyncio
+import functools
+import hashlib
 from datetime import datetime, timezone, timedelta
-import pytz
+from zoneinfo import available_timezones
 import bcrypt
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError as JWTError
 import sqlite3
+import aiosqlite
+from aiosqlitepool import SQLiteConnectionPool
 import json
+import orjson
+from cachetools import TTLCache
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # optional: only needed when REDIS_URL is set
+    redis_asyncio = None
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -23,17 +41,87 @@ DB_PATH = os.environ.get('DATABASE_URL', 'notcluely.db')
 if DB_PATH.startswith('sqlite:///'):
     DB_PATH = DB_PATH.replace('sqlite:///', '')
 
-def get_db():
-    """Get database connection"""
+# Connection pool settings (idle connections kept open between requests)
+DB_POOL_MIN_SIZE = 5
+DB_POOL_MAX_SIZE = 20
+db_pool: Optional[SQLiteConnectionPool] = None  # created in lifespan()
+
+# Optional Redis for state shared between workers (login rate limiting)
+REDIS_URL = os.environ.get('REDIS_URL')
+redis_client = None  # created in lifespan() when REDIS_URL is set
+
+def connect_db():
+    """Open a new synchronous database connection (used by init_db and scripts)"""
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
     return conn
 
+async def connection_factory():
+    """Open a new pooled aiosqlite connection with per-connection PRAGMAs set"""
+    conn = await aiosqlite.connect(DB_PATH)
+    conn.row_factory = aiosqlite.Row
+    await conn.execute("PRAGMA journal_mode=WAL")
+    await conn.execute("PRAGMA synchronous=NORMAL")
+    await conn.execute("PRAGMA temp_store=MEMORY")
+    await conn.execute("PRAGMA mmap_size=268435456")
+    await conn.execute("PRAGMA cache_size=-65536")
+    return conn
+
+def get_db():
+    """Borrow a pooled connection: `async with get_db() as conn: ...`"""
+    return db_pool.connection()
+
+@asynccontextmanager
+async def lifespan(app):
+    """Create the connection pool (and Redis client), pre-warm it, and close it on shutdown"""
+    global db_pool, redis_client
+    if REDIS_URL and redis_asyncio is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed; using the local login rate limiter")
+    elif REDIS_URL:
+        redis_client = redis_asyncio.from_url(REDIS_URL)
+    db_pool = SQLiteConnectionPool(connection_factory, pool_size=DB_POOL_MAX_SIZE)
+    # Hold DB_POOL_MIN_SIZE connections at once so they are all opened up front
+    async with AsyncExitStack() as stack:
+        for _ in range(DB_POOL_MIN_SIZE):
+            await stack.enter_async_context(db_pool.connection())
+    try:
+        yield
+    finally:
+        await db_pool.close()
+        if redis_client is not None:
+            await redis_client.aclose()
+            redis_client = None
+
+@functools.lru_cache(maxsize=4096)
+def parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 string (accepting a trailing Z), memoized per string"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def to_utc_iso(value) -> str:
+    """Normalize a datetime (or ISO string) to canonical UTC form, e.g. 2025-01-01T10:00:00.000Z.
+
+    Booking times are stored in this fixed-width form so that SQLite's string
+    comparison matches chronological order and overlap checks can use an index.
+    """
+    if isinstance(value, str):
+        value = parse_iso(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
 def init_db():
     """Initialize database with tables"""
-    conn = get_db()
+    conn = connect_db()
     cursor = conn.cursor()
     
+    # WAL lets readers run alongside a writer and is sticky on the database
+    # file; NORMAL skips the second fsync per commit, which is safe under WAL.
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA cache_size=-65536')
+    
     # Users table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS users (
@@ -83,6 +171,43 @@ def init_db():
         )
     ''')
     
+    # Indexes for hot lookups (users.id/username and bookings.id are already
+    # covered by their PRIMARY KEY / UNIQUE constraints)
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_bookings_times ON bookings (start_time, end_time)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_bookings_user ON bookings (user_id)')
+    # One index per side of the user1_id / user2_id conflict lookups
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_conflicts_user1 ON conflicts (resolved, user1_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_conflicts_user2 ON conflicts (resolved, user2_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_conflicts_booking1 ON conflicts (booking1_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_conflicts_booking2 ON conflicts (booking2_id)')
+    
+    # Rewrite any legacy booking times into canonical UTC form
+    cursor.execute('''
+        SELECT id, start_time, end_time FROM bookings
+        WHERE start_time NOT GLOB '????-??-??T??:??:??.???Z'
+           OR end_time NOT GLOB '????-??-??T??:??:??.???Z'
+    ''')
+    for row in cursor.fetchall():
+        cursor.execute(
+            'UPDATE bookings SET start_time = ?, end_time = ? WHERE id = ?',
+            (to_utc_iso(row['start_time']), to_utc_iso(row['end_time']), row['id'])
+        )
+    
+    # R*Tree over booking intervals (epoch seconds), keyed by bookings.rowid.
+    # Coordinates are stored as 32-bit floats rounded outward, so it is used as
+    # a coarse overlap filter and matches are re-checked against bookings.
+    # bookings has no INTEGER PRIMARY KEY, so VACUUM may renumber its rowids;
+    # rebuild the index from scratch on every start rather than topping it up.
+    cursor.execute('CREATE VIRTUAL TABLE IF NOT EXISTS bookings_rtree USING rtree(id, start_ts, end_ts)')
+    cursor.execute('DELETE FROM bookings_rtree')
+    cursor.execute('''
+        INSERT INTO bookings_rtree (id, start_ts, end_ts)
+        SELECT rowid,
+               (julianday(start_time) - 2440587.5) * 86400.0,
+               (julianday(end_time) - 2440587.5) * 86400.0
+        FROM bookings
+    ''')
+    
     conn.commit()
     conn.close()
 
@@ -95,23 +220,33 @@ logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+# aiosqlite logs every queued operation at DEBUG
+logging.getLogger('aiosqlite').setLevel(logging.INFO)
 
 # Password hashing constants
 BCRYPT_ROUNDS = 12  # NIST recommended
+# bcrypt releases the GIL, so one worker per core is all the parallelism it can use
+bcrypt_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix='bcrypt')
 
 # JWT settings
 SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'your-secret-key-change-in-production')
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
+ACCESS_TOKEN_TTL = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
 # Security
 security = HTTPBearer()
-LOGIN_ATTEMPTS = {}  # Track login attempts per username
 MAX_LOGIN_ATTEMPTS = 5
 LOCK_TIME_MINUTES = 15
+# IANA zone names from the system tz database (or the tzdata package).
+# 'Factory' and 'localtime' are not real zones, so they are left out.
+VALID_TIMEZONES = frozenset(available_timezones() - {'Factory', 'localtime'})
+# Failed attempt times (time.monotonic()) per username, oldest first. Each
+# new attempt re-inserts the key, so idle usernames age out of the cache.
+LOGIN_ATTEMPTS = TTLCache(maxsize=100000, ttl=LOCK_TIME_MINUTES * 60)
 
-# Create the main app without a prefix
-app = FastAPI()
+# Create the main app without a prefix (orjson for all JSON responses)
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -179,51 +314,130 @@ def get_password_hash(password: str) -> str:
         logger.error(f"Password hashing error: {type(e).__name__}: {e}", exc_info=True)
         raise
 
-def create_access_token(data: dict, is_admin: bool = False):
-    to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire, "is_admin": is_admin})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+# Verified against when a login names an unknown user, so that path costs the
+# same bcrypt work as a wrong password for a real user (no timing oracle)
+DUMMY_PASSWORD_HASH = get_password_hash(uuid.uuid4().hex)
 
-def check_rate_limit(username: str) -> bool:
-    """Check if user has exceeded login attempt limit"""
-    now = datetime.now(timezone.utc)
-    
-    if username not in LOGIN_ATTEMPTS:
-        LOGIN_ATTEMPTS[username] = []
-    
-    # Remove old attempts outside lock window
-    LOGIN_ATTEMPTS[username] = [
-        ts for ts in LOGIN_ATTEMPTS[username]
-        if (now - ts).total_seconds() < (LOCK_TIME_MINUTES * 60)
-    ]
+def create_access_token(sub: str, is_admin: bool = False) -> str:
+    return jwt.encode(
+        {"sub": sub, "exp": datetime.now(timezone.utc) + ACCESS_TOKEN_TTL, "is_admin": is_admin},
+        SECRET_KEY, algorithm=ALGORITHM
+    )
+
+async def stream_json_rows(query, params=(), bool_fields=(), batch_size=256):
+    """Run a SELECT on a pooled connection and stream its rows as a JSON array.
+
+    Rows are pulled in batches with fetchmany() and encoded with orjson, so
+    the full result set is never materialized. The connection is held until
+    the last row is sent. Rows are fetched as plain tuples and zipped with the
+    column names, skipping the intermediate sqlite3.Row objects. SQLite stores
+    booleans as 0/1, so columns listed in bool_fields are converted back to
+    true/false.
+    """
+    async with get_db() as conn:
+        cursor = await conn.execute(query, params)
+        cursor.row_factory = None
+        columns = [d[0] for d in cursor.description]
+        yield b"["
+        first = True
+        while True:
+            rows = await cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            items = []
+            for row in rows:
+                item = dict(zip(columns, row))
+                for field in bool_fields:
+                    item[field] = bool(item[field])
+                items.append(orjson.dumps(item))
+            chunk = b",".join(items)
+            yield chunk if first else b"," + chunk
+            first = False
+        yield b"]"
+
+def _login_attempts_key(username: str) -> str:
+    return f"login_attempts:{username}"
+
+def _local_check_rate_limit(username: str) -> bool:
+    attempts = LOGIN_ATTEMPTS.get(username)
+    if not attempts:
+        return True
     
-    # Check if locked
-    if len(LOGIN_ATTEMPTS[username]) >= MAX_LOGIN_ATTEMPTS:
-        return False
+    # Drop old attempts outside lock window (oldest are at the front)
+    cutoff = time.monotonic() - LOCK_TIME_MINUTES * 60
+    while attempts and attempts[0] < cutoff:
+        attempts.popleft()
     
-    return True
+    return len(attempts) < MAX_LOGIN_ATTEMPTS
+
+def _local_record_login_attempt(username: str):
+    attempts = LOGIN_ATTEMPTS.get(username) or deque(maxlen=MAX_LOGIN_ATTEMPTS)
+    attempts.append(time.monotonic())
+    LOGIN_ATTEMPTS[username] = attempts  # re-insert to refresh the TTL
 
-def record_login_attempt(username: str):
-    """Record a login attempt"""
-    if username not in LOGIN_ATTEMPTS:
-        LOGIN_ATTEMPTS[username] = []
-    LOGIN_ATTEMPTS[username].append(datetime.now(timezone.utc))
+async def check_rate_limit(username: str) -> bool:
+    """Check if user has exceeded login attempt limit.
+
+    With Redis configured the count is shared by all workers; if Redis is
+    unreachable this falls back to the in-process LOGIN_ATTEMPTS cache.
+    """
+    if redis_client is not None:
+        try:
+            count = await redis_client.get(_login_attempts_key(username))
+            return count is None or int(count) < MAX_LOGIN_ATTEMPTS
+        except redis_asyncio.RedisError as e:
+            logger.warning(f"Redis rate limit check failed, using local limiter: {e}")
+    return _local_check_rate_limit(username)
 
-def clear_login_attempts(username: str):
+async def record_login_attempt(username: str):
+    """Record a login attempt (each failure restarts the lock window)"""
+    if redis_client is not None:
+        try:
+            key = _login_attempts_key(username)
+            async with redis_client.pipeline(transaction=True) as pipe:
+                await pipe.incr(key).expire(key, LOCK_TIME_MINUTES * 60).execute()
+            return
+        except redis_asyncio.RedisError as e:
+            logger.warning(f"Redis rate limit update failed, using local limiter: {e}")
+    _local_record_login_attempt(username)
+
+async def clear_login_attempts(username: str):
     """Clear login attempts on successful login"""
-    if username in LOGIN_ATTEMPTS:
-        LOGIN_ATTEMPTS[username] = []
+    LOGIN_ATTEMPTS.pop(username, None)
+    if redis_client is not None:
+        try:
+            await redis_client.delete(_login_attempts_key(username))
+        except redis_asyncio.RedisError as e:
+            logger.warning(f"Redis rate limit reset failed: {e}")
+
+# Resolved users keyed by sha256(token), so repeat requests on the same
+# session skip the users lookup. Entries may be up to AUTH_CACHE_TTL stale.
+AUTH_CACHE_TTL = 30  # seconds
+_auth_cache = TTLCache(maxsize=10000, ttl=AUTH_CACHE_TTL)
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+async def get_current_user(request: Request, credentials: HTTPAuthorizationCredentials = Depends(security)):
+    # Already resolved earlier in this request
+    cached_user = getattr(request.state, 'user', None)
+    if cached_user is not None:
+        return cached_user
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Your session expired. Please log in again.",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    token = credentials.credentials
+    cache_key = hashlib.sha256(token.encode()).digest()
+    cached = _auth_cache.get(cache_key)
+    if cached is not None:
+        exp, user = cached
+        if exp > datetime.now(timezone.utc).timestamp():
+            request.state.user = user
+            return user
+        raise credentials_exception
+    
     try:
-        token = credentials.credentials
+        # Only reached on an _auth_cache miss; jwt.decode also rejects expired tokens
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
         if user_id is None:
@@ -231,20 +445,19 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     except JWTError:
         raise credentials_exception
     
-    conn = get_db()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))
-    user_row = cursor.fetchone()
-    conn.close()
+    async with get_db() as conn:
+        cursor = await conn.execute(
+            'SELECT id, username, timezone, is_admin, created_at FROM users WHERE id = ?', (user_id,)
+        )
+        user_row = await cursor.fetchone()
     
     if user_row is None:
         raise credentials_exception
     
     user = dict(user_row)
     user['is_admin'] = bool(user['is_admin'])
-    # Convert ISO string timestamps back to datetime
-    if isinstance(user.get('created_at'), str):
-        user['created_at'] = datetime.fromisoformat(user['created_at'])
+    _auth_cache[cache_key] = (payload["exp"], user)
+    request.state.user = user
     
     return user
 
@@ -265,7 +478,7 @@ class User(BaseModel):
     password_hash: str
     timezone: str
     is_admin: bool = False
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
 class UserResponse(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -273,7 +486,7 @@ class UserResponse(BaseModel):
     username: str
     timezone: str
     is_admin: bool
-    created_at: datetime
+    created_at: str  # stored ISO string, passed through without re-parsing
 
 class TokenResponse(BaseModel):
     access_token: str
@@ -297,7 +510,7 @@ class Booking(BaseModel):
     end_time: str    # ISO string in UTC
     notes: Optional[str] = None
     user_timezone: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
 class ConflictNotification(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -311,12 +524,21 @@ class ConflictNotification(BaseModel):
     conflict_start: str
     conflict_end: str
     resolved: bool = False
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+# Fixed response bodies, encoded once. A fresh Response is built per request,
+# since middleware (CORS) appends to a response's header list when sending.
+_ROOT_JSON = orjson.dumps({"message": "NotCluely API"})
+_LOGOUT_JSON = orjson.dumps({"message": "Logged out successfully"})
+_SUCCESS_JSON = orjson.dumps({"success": True})
+
+def json_bytes_response(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
 
 # Routes
 @api_router.get("/")
 async def root():
-    return {"message": "NotCluely API"}
+    return json_bytes_response(_ROOT_JSON)
 
 # Auth routes
 @api_router.post("/auth/register", response_model=TokenResponse)
@@ -350,10 +572,17 @@ async def register(user_data: UserRegister):
             detail="Password must be at least 8 characters"
         )
     
-    # Check password complexity
-    has_upper = any(c.isupper() for c in user_data.password)
-    has_lower = any(c.islower() for c in user_data.password)
-    has_digit = any(c.isdigit() for c in user_data.password)
+    # Check password complexity in one pass, stopping once all classes are seen
+    has_upper = has_lower = has_digit = False
+    for c in user_data.password:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        if has_upper and has_lower and has_digit:
+            break
     logger.debug(f"Password complexity - upper: {has_upper}, lower: {has_lower}, digit: {has_digit}")
     
     if not (has_upper and has_lower and has_digit):
@@ -363,26 +592,11 @@ async def register(user_data: UserRegister):
             detail="Password must contain uppercase, lowercase, and digits"
         )
     
-    # Check if username already exists (case-insensitive)
-    logger.debug("Checking for existing username...")
-    conn = get_db()
-    cursor = conn.cursor()
-    cursor.execute('SELECT id FROM users WHERE username = ?', (username,))
-    existing = cursor.fetchone()
-    
-    if existing:
-        conn.close()
-        logger.warning(f"Username already exists: {username}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already exists"
-        )
-    
     # Validate timezone
     if not user_data.timezone:
         user_data.timezone = "UTC"
     
-    if user_data.timezone not in pytz.all_timezones:
+    if user_data.timezone not in VALID_TIMEZONES:
         logger.warning(f"Invalid timezone: {user_data.timezone}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -398,34 +612,50 @@ async def register(user_data: UserRegister):
         logger.info(f"Starting password hashing for user: {username}")
         user_id = str(uuid.uuid4())
         created_at = datetime.now(timezone.utc).isoformat()
-        password_hash = get_password_hash(user_data.password)
+        # bcrypt is CPU-bound, so hash on the bcrypt executor
+        loop = asyncio.get_running_loop()
+        password_hash = await loop.run_in_executor(bcrypt_executor, get_password_hash, user_data.password)
         logger.info(f"Password hash created successfully")
         
+        # The UNIQUE username constraint rejects duplicates atomically, so there
+        # is no separate existence check (and no race between check and insert)
         logger.debug(f"Inserting user into database: {user_id}")
-        cursor.execute('''
-            INSERT INTO users (id, username, password_hash, timezone, is_admin, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (user_id, username, password_hash, user_data.timezone, is_admin, created_at))
+        async with get_db() as conn:
+            cursor = await conn.execute('''
+                INSERT INTO users (id, username, password_hash, timezone, is_admin, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(username) DO NOTHING
+            ''', (user_id, username, password_hash, user_data.timezone, is_admin, created_at))
+            await conn.commit()
         
-        conn.commit()
-        conn.close()
+        if cursor.rowcount == 0:
+            logger.warning(f"Username already exists: {username}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Username already exists"
+            )
         logger.info(f"User registered successfully: {username} (id: {user_id})")
         
         # Create access token with admin status
         logger.debug("Creating access token...")
-        access_token = create_access_token(data={"sub": user_id}, is_admin=is_admin)
+        access_token = create_access_token(user_id, is_admin=is_admin)
         logger.info(f"=== REGISTRATION COMPLETE ===")
         
-        user_response = UserResponse(
-            id=user_id,
-            username=username,
-            timezone=user_data.timezone,
-            is_admin=is_admin,
-            created_at=datetime.fromisoformat(created_at)
-        )
-        
-        return TokenResponse(access_token=access_token, user=user_response)
+        # Values were validated on the way in, so skip response_model re-validation
+        return ORJSONResponse({
+            "access_token": access_token,
+            "token_type": "bearer",
+            "user": {
+                "id": user_id,
+                "username": username,
+                "timezone": user_data.timezone,
+                "is_admin": is_admin,
+                "created_at": created_at
+            }
+        })
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"=== REGISTRATION FAILED ===", exc_info=True)
         logger.error(f"Error type: {type(e).__name__}")
@@ -433,12 +663,29 @@ async def register(user_data: UserRegister):
         if hasattr(e, '__traceback__'):
             import traceback
             logger.error(f"Traceback:\n{traceback.format_exc()}")
-        conn.close()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Registration failed: {str(e)}"
         )
 
+async def fetch_login_user(username: str, is_admin: bool):
+    """Fetch a user row for login, syncing its admin flag on the same connection.
+
+    Admin status depends only on the username, so it is safe to sync before
+    the password check and avoids a second round trip afterwards.
+    """
+    async with get_db() as conn:
+        cursor = await conn.execute(
+            'SELECT id, username, password_hash, timezone, is_admin, created_at FROM users WHERE username = ?',
+            (username,)
+        )
+        user_row = await cursor.fetchone()
+        if user_row and bool(user_row['is_admin']) != is_admin:
+            logger.debug(f"Updating admin status for {username}: {is_admin}")
+            await conn.execute('UPDATE users SET is_admin = ? WHERE id = ?', (is_admin, user_row['id']))
+            await conn.commit()
+    return user_row
+
 @api_router.post("/auth/login", response_model=TokenResponse)
 async def login(user_data: UserLogin):
     logger.info(f"=== LOGIN START ===")
@@ -449,9 +696,11 @@ async def login(user_data: UserLogin):
         username = user_data.username.strip().lower()
         logger.debug(f"Normalized username: {username}")
         
-        # Check rate limit
+        loop = asyncio.get_running_loop()
+        
+        # Check rate limit first so locked-out usernames never touch the database
         logger.debug("Checking rate limit...")
-        if not check_rate_limit(username):
+        if not await check_rate_limit(username):
             logger.warning(f"Rate limit exceeded for user: {username}")
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -459,30 +708,28 @@ async def login(user_data: UserLogin):
             )
         
         logger.debug("Querying database for user...")
-        conn = get_db()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM users WHERE username = ?', (username,))
-        user_row = cursor.fetchone()
-        conn.close()
+        is_admin = username == "rutvik"
+        user_row = await fetch_login_user(username, is_admin)
         
         if not user_row:
             logger.warning(f"User not found: {username}")
-            # Record failed attempt without revealing if user exists
-            record_login_attempt(username)
+            # Record failed attempt without revealing if user exists, burning
+            # the same bcrypt time as a real password check
+            await loop.run_in_executor(bcrypt_executor, verify_password, user_data.password, DUMMY_PASSWORD_HASH)
+            await record_login_attempt(username)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid username or password"
             )
         
         logger.debug(f"User found: {username}")
-        user = dict(user_row)
         
-        # Verify password
+        # Verify password (bcrypt is CPU-bound, so keep it off the event loop)
         logger.debug("Verifying password...")
-        if not verify_password(user_data.password, user['password_hash']):
+        if not await loop.run_in_executor(bcrypt_executor, verify_password, user_data.password, user_row['password_hash']):
             logger.warning(f"Invalid password for user: {username}")
             # Record failed attempt
-            record_login_attempt(username)
+            await record_login_attempt(username)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid username or password"
@@ -492,46 +739,25 @@ async def login(user_data: UserLogin):
         
         # Clear rate limit on successful login
         logger.debug("Clearing login attempts...")
-        clear_login_attempts(username)
-    
-        
-        logger.info(f"Password verified for user: {username}")
-        
-        # Clear rate limit on successful login
-        logger.debug("Clearing login attempts...")
-        clear_login_attempts(username)
-        
-        # Update admin status on every login (in case username changes)
-        is_admin = username == "rutvik"
-        if user.get('is_admin') != is_admin:
-            logger.debug(f"Updating admin status for {username}: {is_admin}")
-            conn = get_db()
-            cursor = conn.cursor()
-            cursor.execute('UPDATE users SET is_admin = ? WHERE id = ?', (is_admin, user['id']))
-            conn.commit()
-            conn.close()
-            user['is_admin'] = is_admin
+        await clear_login_attempts(username)
         
         # Create access token with admin status
         logger.debug("Creating access token...")
-        access_token = create_access_token(data={"sub": user['id']}, is_admin=is_admin)
+        access_token = create_access_token(user_row['id'], is_admin=is_admin)
         logger.info(f"=== LOGIN COMPLETE ===")
         
-        # Convert ISO string timestamps
-        if isinstance(user.get('created_at'), str):
-            user['created_at'] = datetime.fromisoformat(user['created_at'])
-        
-        user['is_admin'] = bool(user['is_admin'])
-        
-        user_response = UserResponse(
-            id=user['id'],
-            username=user['username'],
-            timezone=user['timezone'],
-            is_admin=user['is_admin'],
-            created_at=user['created_at']
-        )
-        
-        return TokenResponse(access_token=access_token, user=user_response)
+        # Trusted DB row, so skip response_model re-validation
+        return ORJSONResponse({
+            "access_token": access_token,
+            "token_type": "bearer",
+            "user": {
+                "id": user_row['id'],
+                "username": user_row['username'],
+                "timezone": user_row['timezone'],
+                "is_admin": is_admin,
+                "created_at": user_row['created_at']
+            }
+        })
     
     except HTTPException:
         raise
@@ -548,51 +774,43 @@ async def get_me(current_user: dict = Depends(get_current_user)):
     logger.debug(f"=== GET ME (current user info) ===")
     logger.debug(f"User: {current_user['username']} (id: {current_user['id']})")
     
-    return UserResponse(
-        id=current_user['id'],
-        username=current_user['username'],
-        timezone=current_user['timezone'],
-        is_admin=current_user['is_admin'],
-        created_at=current_user['created_at']
-    )
+    # Already-validated DB row, so bypass response_model re-validation
+    return ORJSONResponse({
+        "id": current_user['id'],
+        "username": current_user['username'],
+        "timezone": current_user['timezone'],
+        "is_admin": current_user['is_admin'],
+        "created_at": current_user['created_at']
+    })
 
 @api_router.post("/auth/logout")
 async def logout():
     # In JWT, logout is handled client-side by removing the token
-    return {"message": "Logged out successfully"}
+    return json_bytes_response(_LOGOUT_JSON)
 
 # User routes
 @api_router.put("/users/timezone")
 async def update_user_timezone(timezone: str, current_user: dict = Depends(get_current_user)):
-    conn = get_db()
-    cursor = conn.cursor()
-    cursor.execute('UPDATE users SET timezone = ? WHERE id = ?', (timezone, current_user['id']))
-    conn.commit()
+    if timezone not in VALID_TIMEZONES:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid timezone")
+    
+    async with get_db() as conn:
+        cursor = await conn.execute('UPDATE users SET timezone = ? WHERE id = ?', (timezone, current_user['id']))
+        await conn.commit()
     
     if cursor.rowcount == 0:
-        conn.close()
         raise HTTPException(status_code=404, detail="User not found")
     
-    conn.close()
-    return {"success": True}
+    # Keep this session's cached user in step with the row
+    current_user['timezone'] = timezone
+    return json_bytes_response(_SUCCESS_JSON)
 
 @api_router.get("/users", response_model=List[UserResponse])
 async def get_all_users(current_user: dict = Depends(get_current_user)):
-    conn = get_db()
-    cursor = conn.cursor()
-    cursor.execute('SELECT id, username, timezone, is_admin, created_at FROM users')
-    users_rows = cursor.fetchall()
-    conn.close()
-    
-    result = []
-    for user_row in users_rows:
-        user = dict(user_row)
-        user['is_admin'] = bool(user['is_admin'])
-        if isinstance(user['created_at'], str):
-            user['created_at'] = datetime.fromisoformat(user['created_at'])
-        result.append(UserResponse(**user))
-    
-    return result
+    return StreamingResponse(
+        stream_json_rows('SELECT id, username, timezone, is_admin, created_at FROM users', bool_fields=('is_admin',)),
+        media_type="application/json"
+    )
 
 # Booking routes
 @api_router.post("/bookings", response_model=Booking)
@@ -619,11 +837,11 @@ async def create_booking(booking_data: BookingCreate, current_user: dict = Depen
         
         # Check for conflicts
         logger.debug(f"Parsing start_time: {booking_data.start_time}")
-        start_dt = datetime.fromisoformat(booking_data.start_time.replace('Z', '+00:00'))
+        start_dt = parse_iso(booking_data.start_time)
         logger.debug(f"Parsed start_time: {start_dt}")
         
         logger.debug(f"Parsing end_time: {booking_data.end_time}")
-        end_dt = datetime.fromisoformat(booking_data.end_time.replace('Z', '+00:00'))
+        end_dt = parse_iso(booking_data.end_time)
         logger.debug(f"Parsed end_time: {end_dt}")
         
         # Validate date range
@@ -644,80 +862,85 @@ async def create_booking(booking_data: BookingCreate, current_user: dict = Depen
                 detail="Start time must be before end time"
             )
         
-        logger.debug("Fetching existing bookings...")
-        conn = get_db()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM bookings')
-        existing_bookings = [dict(row) for row in cursor.fetchall()]
-        logger.debug(f"Found {len(existing_bookings)} existing bookings")
-        
-        conflicts = []
-        for existing in existing_bookings:
-            existing_start = datetime.fromisoformat(existing['start_time'].replace('Z', '+00:00'))
-            existing_end = datetime.fromisoformat(existing['end_time'].replace('Z', '+00:00'))
-            
-            # Check for overlap
-            if (start_dt < existing_end and end_dt > existing_start):
-                logger.info(f"Found conflict with booking {existing['id']}")
-                conflicts.append(existing)
-        
-        logger.info(f"Total conflicts found: {len(conflicts)}")
+        # Store times in canonical UTC form so overlap checks can be done in SQL
+        start_time = to_utc_iso(start_dt)
+        end_time = to_utc_iso(end_dt)
         
-        # Create booking
-        booking_id = str(uuid.uuid4())
-        created_at = datetime.now(timezone.utc).isoformat()
-        logger.debug(f"Creating booking: id={booking_id}, title={booking_data.title}")
-        
-        cursor.execute('''
-            INSERT INTO bookings (id, user_id, user_name, title, start_time, end_time, notes, user_timezone, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            booking_id, current_user['id'], current_user['username'], 
-            booking_data.title, booking_data.start_time, booking_data.end_time, 
-            booking_data.notes, booking_data.user_timezone, created_at
-        ))
-        
-        conn.commit()
-        logger.debug("Booking inserted into database")
-        
-        # Create conflict notifications if there are conflicts
-        for conflict in conflicts:
-            conflict_id = str(uuid.uuid4())
-            conflict_notif_created_at = datetime.now(timezone.utc).isoformat()
-            logger.debug(f"Creating conflict record: id={conflict_id}")
+        logger.debug("Fetching overlapping bookings...")
+        async with get_db() as conn:
+            # One write transaction covers the overlap check, the booking and
+            # its conflict rows, so they commit together with a single fsync
+            await conn.execute('BEGIN IMMEDIATE')
+            cursor = await conn.execute('''
+                SELECT b.id, b.user_id, b.user_name, b.start_time, b.end_time FROM bookings_rtree r
+                JOIN bookings b ON b.rowid = r.id
+                WHERE r.start_ts < ? AND r.end_ts > ?
+                  AND b.start_time < ? AND b.end_time > ?
+            ''', (end_dt.timestamp(), start_dt.timestamp(), end_time, start_time))
+            conflicts = await cursor.fetchall()
+            for existing in conflicts:
+                logger.info(f"Found conflict with booking {existing['id']}")
+            
+            logger.info(f"Total conflicts found: {len(conflicts)}")
+            
+            # Create booking
+            booking_id = str(uuid.uuid4())
+            created_at = datetime.now(timezone.utc).isoformat()
+            logger.debug(f"Creating booking: id={booking_id}, title={booking_data.title}")
             
-            cursor.execute('''
-                INSERT INTO conflicts (id, booking1_id, booking2_id, user1_id, user2_id, user1_name, user2_name, conflict_start, conflict_end, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            cursor = await conn.execute('''
+                INSERT INTO bookings (id, user_id, user_name, title, start_time, end_time, notes, user_timezone, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
-                conflict_id, conflict['id'], booking_id, conflict['user_id'], current_user['id'],
-                conflict['user_name'], current_user['username'],
-                max(booking_data.start_time, conflict['start_time']),
-                min(booking_data.end_time, conflict['end_time']),
-                conflict_notif_created_at
+                booking_id, current_user['id'], current_user['username'], 
+                booking_data.title, start_time, end_time, 
+                booking_data.notes, booking_data.user_timezone, created_at
             ))
-        
-        conn.commit()
-        conn.close()
+            await conn.execute(
+                # REPLACE: never fail a booking on a stale index row for a reused rowid
+                'INSERT OR REPLACE INTO bookings_rtree (id, start_ts, end_ts) VALUES (?, ?, ?)',
+                (cursor.lastrowid, start_dt.timestamp(), end_dt.timestamp())
+            )
+            logger.debug("Booking inserted")
+            
+            # Create conflict notifications if there are conflicts (one batched insert)
+            if conflicts:
+                conflict_rows = [
+                    (
+                        str(uuid.uuid4()), conflict['id'], booking_id, conflict['user_id'], current_user['id'],
+                        conflict['user_name'], current_user['username'],
+                        max(start_time, conflict['start_time']),
+                        min(end_time, conflict['end_time']),
+                        created_at
+                    )
+                    for conflict in conflicts
+                ]
+                logger.debug(f"Creating {len(conflict_rows)} conflict records")
+                
+                await conn.executemany('''
+                    INSERT INTO conflicts (id, booking1_id, booking2_id, user1_id, user2_id, user1_name, user2_name, conflict_start, conflict_end, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', conflict_rows)
+            
+            await conn.commit()
         logger.info(f"=== CREATE BOOKING COMPLETE ===")
         
-        return Booking(
-            id=booking_id,
-            user_id=current_user['id'],
-            user_name=current_user['username'],
-            title=booking_data.title,
-            start_time=booking_data.start_time,
-            end_time=booking_data.end_time,
-            notes=booking_data.notes,
-            user_timezone=booking_data.user_timezone,
-            created_at=datetime.fromisoformat(created_at)
-        )
+        # Echo the stored row directly, bypassing response_model re-validation
+        return ORJSONResponse({
+            "id": booking_id,
+            "user_id": current_user['id'],
+            "user_name": current_user['username'],
+            "title": booking_data.title,
+            "start_time": start_time,
+            "end_time": end_time,
+            "notes": booking_data.notes,
+            "user_timezone": booking_data.user_timezone,
+            "created_at": created_at
+        })
     
     except Exception as e:
         logger.error(f"=== CREATE BOOKING FAILED ===", exc_info=True)
         logger.error(f"Error type: {type(e).__name__}: {str(e)}")
-        if 'conn' in locals():
-            conn.close()
         raise
 
 @api_router.get("/bookings", response_model=List[Booking])
@@ -725,28 +948,14 @@ async def get_bookings(current_user: dict = Depends(get_current_user)):
     logger.info(f"=== GET BOOKINGS START ===")
     logger.debug(f"User: {current_user.get('username')}, is_admin: {current_user.get('is_admin')}")
     
-    try:
-        conn = get_db()
-        cursor = conn.cursor()
-        
-        # If admin, return all bookings. Otherwise, return only their own.
-        if current_user.get('is_admin', False):
-            logger.debug("Admin user - fetching all bookings")
-            cursor.execute('SELECT * FROM bookings')
+    # If admin, return all bookings. Otherwise, return only their own.
+    if current_user.get('is_admin', False):
+        logger.debug("Admin user - fetching all bookings")
+        rows = stream_json_rows('SELECT * FROM bookings')
     else:
-        cursor.execute('SELECT * FROM bookings WHERE user_id = ?', (current_user['id'],))
-    
-    bookings_rows = cursor.fetchall()
-    conn.close()
-    
-    result = []
-    for booking_row in bookings_rows:
-        booking = dict(booking_row)
-        if isinstance(booking['created_at'], str):
-            booking['created_at'] = datetime.fromisoformat(booking['created_at'])
-        result.append(Booking(**booking))
+        rows = stream_json_rows('SELECT * FROM bookings WHERE user_id = ?', (current_user['id'],))
     
-    return result
+    return StreamingResponse(rows, media_type="application/json")
 
 @api_router.delete("/bookings/{booking_id}")
 async def delete_booking(booking_id: str, current_user: dict = Depends(get_current_user)):
@@ -754,46 +963,44 @@ async def delete_booking(booking_id: str, current_user: dict = Depends(get_curre
     logger.info(f"Booking ID: {booking_id}, User: {current_user['username']}")
     
     try:
-        conn = get_db()
-        cursor = conn.cursor()
-        
-        # Get booking
-        logger.debug(f"Fetching booking {booking_id}...")
-        cursor.execute('SELECT * FROM bookings WHERE id = ?', (booking_id,))
-        booking_row = cursor.fetchone()
-        
-        if not booking_row:
-            logger.warning(f"Booking not found: {booking_id}")
-            conn.close()
-            raise HTTPException(status_code=404, detail="Booking not found")
-        
-        booking = dict(booking_row)
-        logger.debug(f"Found booking: {booking['title']} by {booking['user_name']}")
-        
-        # Check if user owns the booking or is admin
-        if booking['user_id'] != current_user['id'] and not current_user.get('is_admin', False):
-            logger.warning(f"Unauthorized delete attempt by {current_user['username']} on booking {booking_id}")
-            conn.close()
-            raise HTTPException(
-                status_code=403, 
-                detail="You do not have permission to delete this booking"
+        async with get_db() as conn:
+            # Get booking
+            logger.debug(f"Fetching booking {booking_id}...")
+            cursor = await conn.execute('SELECT user_id FROM bookings WHERE id = ?', (booking_id,))
+            booking_row = await cursor.fetchone()
+            
+            if not booking_row:
+                logger.warning(f"Booking not found: {booking_id}")
+                raise HTTPException(status_code=404, detail="Booking not found")
+            
+            logger.debug(f"Found booking owned by {booking_row['user_id']}")
+            
+            # Check if user owns the booking or is admin
+            if booking_row['user_id'] != current_user['id'] and not current_user.get('is_admin', False):
+                logger.warning(f"Unauthorized delete attempt by {current_user['username']} on booking {booking_id}")
+                raise HTTPException(
+                    status_code=403, 
+                    detail="You do not have permission to delete this booking"
+                )
+            
+            logger.debug(f"Deleting booking {booking_id}...")
+            await conn.execute(
+                'DELETE FROM bookings_rtree WHERE id = (SELECT rowid FROM bookings WHERE id = ?)',
+                (booking_id,)
             )
-        
-        logger.debug(f"Deleting booking {booking_id}...")
-        cursor.execute('DELETE FROM bookings WHERE id = ?', (booking_id,))
-        
-        # Delete related conflicts
-        logger.debug(f"Deleting related conflicts...")
-        cursor.execute('''
-            DELETE FROM conflicts 
-            WHERE booking1_id = ? OR booking2_id = ?
-        ''', (booking_id, booking_id))
-        
-        conn.commit()
-        conn.close()
+            await conn.execute('DELETE FROM bookings WHERE id = ?', (booking_id,))
+            
+            # Delete related conflicts
+            logger.debug(f"Deleting related conflicts...")
+            await conn.execute('''
+                DELETE FROM conflicts 
+                WHERE booking1_id = ? OR booking2_id = ?
+            ''', (booking_id, booking_id))
+            
+            await conn.commit()
         logger.info(f"=== DELETE BOOKING COMPLETE ===")
         
-        return {"success": True}
+        return json_bytes_response(_SUCCESS_JSON)
     
     except HTTPException:
         raise
@@ -806,78 +1013,61 @@ async def delete_booking(booking_id: str, current_user: dict = Depends(get_curre
         )
 
 # Conflict routes
+
+# Unresolved conflicts involving a user. Written as two index lookups
+# (idx_conflicts_user1 / idx_conflicts_user2) instead of a single OR, with
+# the second branch skipping rows already returned by the first.
+USER_CONFLICTS_QUERY = '''
+    SELECT * FROM conflicts WHERE resolved = 0 AND user1_id = ?
+    UNION ALL
+    SELECT * FROM conflicts WHERE resolved = 0 AND user2_id = ? AND user1_id != ?
+'''
+
 @api_router.get("/conflicts", response_model=List[ConflictNotification])
 async def get_conflicts(current_user: dict = Depends(get_current_user)):
     logger.debug(f"=== GET CONFLICTS START ===")
     logger.debug(f"User: {current_user['username']}, is_admin: {current_user.get('is_admin')}")
     
-    try:
-        conn = get_db()
-        cursor = conn.cursor()
-        
-        if current_user.get('is_admin', False):
-            logger.debug("Admin user - fetching all unresolved conflicts")
-            cursor.execute('SELECT * FROM conflicts WHERE resolved = 0')
-        else:
-            logger.debug(f"Regular user - fetching conflicts for {current_user['username']}")
-            cursor.execute('''
-                SELECT * FROM conflicts 
-                WHERE resolved = 0 AND (user1_id = ? OR user2_id = ?)
-            ''', (current_user['id'], current_user['id']))
-    
-    conflicts_rows = cursor.fetchall()
-    conn.close()
-    
-    result = []
-    for conflict_row in conflicts_rows:
-        conflict = dict(conflict_row)
-        conflict['resolved'] = bool(conflict['resolved'])
-        if isinstance(conflict['created_at'], str):
-            conflict['created_at'] = datetime.fromisoformat(conflict['created_at'])
-        result.append(ConflictNotification(**conflict))
+    if current_user.get('is_admin', False):
+        logger.debug("Admin user - fetching all unresolved conflicts")
+        query, params = 'SELECT * FROM conflicts WHERE resolved = 0', ()
+    else:
+        logger.debug(f"Regular user - fetching conflicts for {current_user['username']}")
+        query, params = USER_CONFLICTS_QUERY, (current_user['id'],) * 3
     
-    return result
+    return StreamingResponse(
+        stream_json_rows(query, params, bool_fields=('resolved',)),
+        media_type="application/json"
+    )
 
 @api_router.get("/conflicts/user", response_model=List[ConflictNotification])
 async def get_user_conflicts(current_user: dict = Depends(get_current_user)):
-    conn = get_db()
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT * FROM conflicts
-        WHERE (user1_id = ? OR user2_id = ?) AND resolved = 0
-    ''', (current_user['id'], current_user['id']))
-    
-    conflicts_rows = cursor.fetchall()
-    conn.close()
-    
-    result = []
-    for conflict_row in conflicts_rows:
-        conflict = dict(conflict_row)
-        conflict['resolved'] = bool(conflict['resolved'])
-        if isinstance(conflict['created_at'], str):
-            conflict['created_at'] = datetime.fromisoformat(conflict['created_at'])
-        result.append(ConflictNotification(**conflict))
-    
-    return result
+    return StreamingResponse(
+        stream_json_rows(USER_CONFLICTS_QUERY, (current_user['id'],) * 3, bool_fields=('resolved',)),
+        media_type="application/json"
+    )
 
 @api_router.put("/conflicts/{conflict_id}/resolve")
 async def resolve_conflict(conflict_id: str, current_user: dict = Depends(get_current_user)):
-    conn = get_db()
-    cursor = conn.cursor()
-    cursor.execute('UPDATE conflicts SET resolved = 1 WHERE id = ?', (conflict_id,))
-    conn.commit()
+    async with get_db() as conn:
+        cursor = await conn.execute('UPDATE conflicts SET resolved = 1 WHERE id = ?', (conflict_id,))
+        await conn.commit()
     
     if cursor.rowcount == 0:
-        conn.close()
         raise HTTPException(status_code=404, detail="Conflict not found")
     
-    conn.close()
-    return {"success": True}
+    return json_bytes_response(_SUCCESS_JSON)
+
+# Timezone utility endpoint (static sorted list, encoded once at import)
+_TIMEZONES_JSON = orjson.dumps({"timezones": sorted(VALID_TIMEZONES)})
 
-# Timezone utility endpoint
 @api_router.get("/timezones")
 async def get_timezones():
-    return {"timezones": pytz.all_timezones}
+    return Response(
+        content=_TIMEZONES_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=86400"}
+    )
 
 # Include the router in the main app
 app.include_router(api_router)
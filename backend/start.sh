@@ -10,4 +10,4 @@ fi
 python -c "from server import init_db; init_db()"
 
 # Start the server
-uvicorn server:app --host 0.0.0.0 --port ${PORT:-8000}
+uvicorn server:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop
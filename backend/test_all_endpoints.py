@@ -1,13 +1,24 @@
 """
 Comprehensive API tests for NotCluely backend.
 Tests all endpoints with proper error handling and logging.
+
+Set REUSE_TOKENS=1 to reuse tokens and the timezone list from the last run
+(cached in .test_cache.json for 10 minutes) and skip registration/login.
+Set VERBOSE_ERRORS=1 to include tracebacks when a request raises.
 """
 
-import requests
-import json
+import asyncio
+import aiohttp
+import orjson
+import os
+from pathlib import Path
 from datetime import datetime, timezone, timedelta
 import logging
 
+from api_test_utils import (
+    REUSE_TOKENS, bearer_headers, load_cache, orjson_dumps, save_cache, token_is_valid
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,6 +30,18 @@ logger = logging.getLogger(__name__)
 BASE_URL = "http://localhost:8000/api"
 # For Render: BASE_URL = "https://notcluely-backend.onrender.com/api"
 
+# Cross-run cache of tokens and timezones (see api_test_utils)
+CACHE_FILE = Path(__file__).with_name(".test_cache.json")
+
+# Attach tracebacks to exception logs only when asked (VERBOSE_ERRORS=1)
+VERBOSE_ERRORS = os.environ.get("VERBOSE_ERRORS") == "1"
+
+# HTTP client tuning: bounded per-host fan-out, cached DNS, and fail fast
+# instead of hanging on a dead server
+CONNECTION_LIMIT_PER_HOST = 32
+DNS_CACHE_TTL_SECONDS = 300
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=2)
+
 # Test credentials
 TEST_USER_1 = {
     "username": "testuser1",
@@ -35,269 +58,392 @@ ADMIN_USER = {
     "password": "Qa@12345678"
 }
 
+BANNER = "=" * 60
+
+def log_banner(title):
+    """Log a section banner as one record, formatted only if INFO is enabled"""
+    logger.info("\n%s\nTESTING: %s\n%s", BANNER, title, BANNER)
+
+class LazyJSON:
+    """Pretty-prints data as JSON only when a log record is actually rendered"""
+    __slots__ = ("data", "limit")
+    
+    def __init__(self, data, limit=None):
+        self.data = data
+        self.limit = limit
+    
+    def __str__(self):
+        text = orjson.dumps(self.data, option=orjson.OPT_INDENT_2).decode()
+        return text if self.limit is None else text[:self.limit]
+
 class APITester:
     def __init__(self, base_url):
         self.base_url = base_url
+        self.urls = {
+            name: f"{base_url}/{path}"
+            for name, path in [
+                ("health", ""),
+                ("register", "auth/register"),
+                ("login", "auth/login"),
+                ("me", "auth/me"),
+                ("bookings", "bookings"),
+                ("conflicts", "conflicts"),
+                ("timezones", "timezones"),
+            ]
+        }
+        self.url_booking = self.urls["bookings"] + "/{}"
         self.tokens = {}
+        self.auth_headers = {}  # username -> headers dict, built once per token
         self.bookings = {}
+        self.session = None  # aiohttp.ClientSession, opened in run_all_tests()
+        self.timezones = None
         
     def log_response(self, endpoint, method, status_code, data):
-        """Log API response"""
-        logger.info(f"{method} {endpoint} - Status: {status_code}")
+        """Log API response (bodies are only encoded if the record is emitted)"""
+        logger.info("%s %s - Status: %d", method, endpoint, status_code)
         if status_code >= 400:
-            logger.error(f"Response: {json.dumps(data, indent=2)}")
-        else:
-            logger.debug(f"Response: {json.dumps(data, indent=2)[:200]}...")
+            logger.error("Response: %s", LazyJSON(data))
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response: %s...", LazyJSON(data, limit=200))
+    
+    def set_token(self, username, token):
+        """Store a user's token along with its prebuilt Authorization header"""
+        self.tokens[username] = token
+        self.auth_headers[username] = bearer_headers(token)
+    
+    async def restore_cached_tokens(self):
+        """Reuse cached tokens that /auth/me still accepts; True if every test user has one"""
+        cached = load_cache(CACHE_FILE, self.base_url)
+        self.timezones = cached.get("timezones")
+        
+        tokens = cached.get("tokens", {})
+        results = await asyncio.gather(
+            *(token_is_valid(self.session, self.urls["me"], t) for t in tokens.values()),
+            return_exceptions=True
+        )
+        for (username, token), ok in zip(tokens.items(), results):
+            if ok is True:
+                self.set_token(username, token)
+        
+        restored = all(user["username"] in self.tokens for user in [TEST_USER_1, TEST_USER_2])
+        if restored:
+            logger.info(f"Reusing cached tokens for: {', '.join(self.tokens)}")
+        return restored
     
-    def test_registration(self):
+    async def check_health(self):
+        """Return True if the API root answers 200; one request, errors logged"""
+        try:
+            async with self.session.get(self.urls["health"]) as response:
+                if response.status == 200:
+                    return True
+                logger.error("✗ Health check failed: status %d", response.status)
+        except Exception as e:
+            logger.error("✗ Health check failed: %s: %s", type(e).__name__, e, exc_info=VERBOSE_ERRORS)
+        return False
+    
+    async def test_registration(self):
         """Test user registration"""
-        logger.info("\n" + "="*60)
-        logger.info("TESTING: User Registration")
-        logger.info("="*60)
+        log_banner("User Registration")
         
-        for user in [TEST_USER_1, TEST_USER_2]:
-            try:
-                endpoint = f"{self.base_url}/auth/register"
-                payload = {
-                    "username": user["username"],
-                    "password": user["password"],
-                    "timezone": "Asia/Calcutta"
-                }
-                
-                logger.info(f"\nRegistering user: {user['username']}")
-                response = requests.post(endpoint, json=payload)
-                data = response.json()
-                self.log_response(endpoint, "POST", response.status_code, data)
+        # Each registration is independent, so send them all at once over
+        # the shared session's pooled connections
+        await asyncio.gather(*(self._register(user) for user in [TEST_USER_1, TEST_USER_2]))
+    
+    async def _register(self, user):
+        try:
+            endpoint = self.urls["register"]
+            payload = {
+                "username": user["username"],
+                "password": user["password"],
+                "timezone": "Asia/Calcutta"
+            }
+            
+            logger.info(f"\nRegistering user: {user['username']}")
+            async with self.session.post(endpoint, json=payload) as response:
+                data = await response.json(loads=orjson.loads)
+            self.log_response(endpoint, "POST", response.status, data)
+            
+            if response.status == 200:
+                logger.info(f"✓ Registration successful for {user['username']}")
+                self.set_token(user['username'], data.get('access_token'))
+                logger.debug(f"Token: {data.get('access_token')[:20]}...")
+            else:
+                logger.error("✗ Registration failed: %s", data.get("detail"))
                 
-                if response.status_code == 200:
-                    logger.info(f"✓ Registration successful for {user['username']}")
-                    self.tokens[user['username']] = data.get('access_token')
-                    logger.debug(f"Token: {data.get('access_token')[:20]}...")
-                else:
-                    logger.error(f"✗ Registration failed: {data.get('detail')}")
-                    
-            except Exception as e:
-                logger.error(f"✗ Exception during registration: {type(e).__name__}: {str(e)}")
+        except Exception as e:
+            logger.error("✗ Exception during registration: %s: %s", type(e).__name__, e, exc_info=VERBOSE_ERRORS)
     
-    def test_login(self):
+    async def test_login(self):
         """Test user login"""
-        logger.info("\n" + "="*60)
-        logger.info("TESTING: User Login")
-        logger.info("="*60)
+        log_banner("User Login")
         
-        for user in [TEST_USER_1, TEST_USER_2, ADMIN_USER]:
-            try:
-                endpoint = f"{self.base_url}/auth/login"
-                payload = {
-                    "username": user["username"],
-                    "password": user["password"]
-                }
-                
-                logger.info(f"\nLogging in user: {user['username']}")
-                response = requests.post(endpoint, json=payload)
-                data = response.json()
-                self.log_response(endpoint, "POST", response.status_code, data)
+        results = await asyncio.gather(*(
+            self._login(user) for user in [TEST_USER_1, TEST_USER_2, ADMIN_USER]
+        ))
+        # Store tokens after the fan-out so they keep the users' order
+        for username, token in filter(None, results):
+            self.set_token(username, token)
+    
+    async def _login(self, user):
+        """Log one user in; return (username, token) on success, else None"""
+        try:
+            endpoint = self.urls["login"]
+            payload = {
+                "username": user["username"],
+                "password": user["password"]
+            }
+            
+            logger.info(f"\nLogging in user: {user['username']}")
+            async with self.session.post(endpoint, json=payload) as response:
+                data = await response.json(loads=orjson.loads)
+            self.log_response(endpoint, "POST", response.status, data)
+            
+            if response.status == 200:
+                logger.info(f"✓ Login successful for {user['username']}")
+                logger.debug(f"Token: {data.get('access_token')[:20]}...")
+                return user['username'], data.get('access_token')
+            logger.error("✗ Login failed: %s", data.get("detail"))
                 
-                if response.status_code == 200:
-                    logger.info(f"✓ Login successful for {user['username']}")
-                    self.tokens[user['username']] = data.get('access_token')
-                    logger.debug(f"Token: {data.get('access_token')[:20]}...")
-                else:
-                    logger.error(f"✗ Login failed: {data.get('detail')}")
-                    
-            except Exception as e:
-                logger.error(f"✗ Exception during login: {type(e).__name__}: {str(e)}")
+        except Exception as e:
+            logger.error("✗ Exception during login: %s: %s", type(e).__name__, e, exc_info=VERBOSE_ERRORS)
+        return None
     
-    def test_get_me(self):
+    async def test_get_me(self):
         """Test get current user info"""
-        logger.info("\n" + "="*60)
-        logger.info("TESTING: Get Current User Info")
-        logger.info("="*60)
+        log_banner("Get Current User Info")
+        if not self.tokens:
+            logger.warning("No tokens available, skipping %s", "Get Current User Info")
+            return
         
-        for username, token in self.tokens.items():
-            try:
-                endpoint = f"{self.base_url}/auth/me"
-                headers = {"Authorization": f"Bearer {token}"}
-                
-                logger.info(f"\nFetching user info for: {username}")
-                response = requests.get(endpoint, headers=headers)
-                data = response.json()
-                self.log_response(endpoint, "GET", response.status_code, data)
+        # Users are independent, so fetch them all concurrently
+        await asyncio.gather(*(
+            self._get_me(username) for username in self.auth_headers
+        ))
+    
+    async def _get_me(self, username):
+        try:
+            endpoint = self.urls["me"]
+            headers = self.auth_headers[username]
+            
+            logger.info(f"\nFetching user info for: {username}")
+            async with self.session.get(endpoint, headers=headers) as response:
+                data = await response.json(loads=orjson.loads)
+            self.log_response(endpoint, "GET", response.status, data)
+            
+            if response.status == 200:
+                logger.info(f"✓ Get me successful for {username}")
+            else:
+                logger.error("✗ Get me failed: %s", data.get("detail"))
                 
-                if response.status_code == 200:
-                    logger.info(f"✓ Get me successful for {username}")
-                else:
-                    logger.error(f"✗ Get me failed: {data.get('detail')}")
-                    
-            except Exception as e:
-                logger.error(f"✗ Exception during get me: {type(e).__name__}: {str(e)}")
+        except Exception as e:
+            logger.error("✗ Exception during get me: %s: %s", type(e).__name__, e, exc_info=VERBOSE_ERRORS)
     
-    def test_create_bookings(self):
+    async def test_create_bookings(self):
         """Test creating bookings"""
-        logger.info("\n" + "="*60)
-        logger.info("TESTING: Create Bookings")
-        logger.info("="*60)
+        log_banner("Create Bookings")
+        if not self.tokens:
+            logger.warning("No tokens available, skipping %s", "Create Bookings")
+            return
         
-        # Create bookings for test users
-        users_to_book = [TEST_USER_1, TEST_USER_2]
+        # Create bookings for test users, staggered from one shared "now"
+        now = datetime.now(timezone.utc)
+        bookings_to_create = []
+        for i, user in enumerate([TEST_USER_1, TEST_USER_2]):
+            if user['username'] not in self.tokens:
+                logger.warning(f"No token for {user['username']}, skipping...")
+                continue
+            start_time = now + timedelta(days=1, hours=i*2)  # Stagger bookings
+            end_time = start_time + timedelta(hours=1)
+            payload = {
+                "title": f"Meeting {i+1} by {user['username']}",
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+                "notes": f"Test booking {i+1}",
+                "user_timezone": "Asia/Calcutta"
+            }
+            bookings_to_create.append((user['username'], payload))
         
-        for i, user in enumerate(users_to_book):
-            try:
-                if user['username'] not in self.tokens:
-                    logger.warning(f"No token for {user['username']}, skipping...")
-                    continue
-                
-                endpoint = f"{self.base_url}/bookings"
-                token = self.tokens[user['username']]
-                headers = {"Authorization": f"Bearer {token}"}
-                
-                # Create booking starting tomorrow
-                now = datetime.now(timezone.utc)
-                start_time = now + timedelta(days=1, hours=i*2)  # Stagger bookings
-                end_time = start_time + timedelta(hours=1)
-                
-                payload = {
-                    "title": f"Meeting {i+1} by {user['username']}",
-                    "start_time": start_time.isoformat(),
-                    "end_time": end_time.isoformat(),
-                    "notes": f"Test booking {i+1}",
-                    "user_timezone": "Asia/Calcutta"
-                }
-                
-                logger.info(f"\nCreating booking for {user['username']}")
-                logger.debug(f"Start: {start_time.isoformat()}, End: {end_time.isoformat()}")
-                response = requests.post(endpoint, json=payload, headers=headers)
-                data = response.json()
-                self.log_response(endpoint, "POST", response.status_code, data)
+        await asyncio.gather(*(
+            self._create_booking(username, payload) for username, payload in bookings_to_create
+        ))
+    
+    async def _create_booking(self, username, payload):
+        try:
+            endpoint = self.urls["bookings"]
+            headers = self.auth_headers[username]
+            
+            logger.info(f"\nCreating booking for {username}")
+            logger.debug(f"Start: {payload['start_time']}, End: {payload['end_time']}")
+            async with self.session.post(endpoint, json=payload, headers=headers) as response:
+                data = await response.json(loads=orjson.loads)
+            self.log_response(endpoint, "POST", response.status, data)
+            
+            if response.status == 200:
+                logger.info(f"✓ Booking created successfully")
+                self.bookings[username] = data.get('id')
+                logger.debug(f"Booking ID: {data.get('id')}")
+            else:
+                logger.error("✗ Booking creation failed: %s", data.get("detail"))
                 
-                if response.status_code == 200:
-                    logger.info(f"✓ Booking created successfully")
-                    self.bookings[user['username']] = data.get('id')
-                    logger.debug(f"Booking ID: {data.get('id')}")
-                else:
-                    logger.error(f"✗ Booking creation failed: {data.get('detail')}")
-                    
-            except Exception as e:
-                logger.error(f"✗ Exception during create booking: {type(e).__name__}: {str(e)}", exc_info=True)
+        except Exception as e:
+            logger.error("✗ Exception during create booking: %s: %s", type(e).__name__, e, exc_info=VERBOSE_ERRORS)
     
-    def test_get_bookings(self):
+    async def test_get_bookings(self):
         """Test fetching bookings"""
-        logger.info("\n" + "="*60)
-        logger.info("TESTING: Get Bookings")
-        logger.info("="*60)
+        log_banner("Get Bookings")
+        if not self.tokens:
+            logger.warning("No tokens available, skipping %s", "Get Bookings")
+            return
         
-        for username, token in self.tokens.items():
-            try:
-                endpoint = f"{self.base_url}/bookings"
-                headers = {"Authorization": f"Bearer {token}"}
-                
-                logger.info(f"\nFetching bookings for: {username}")
-                response = requests.get(endpoint, headers=headers)
-                data = response.json()
-                self.log_response(endpoint, "GET", response.status_code, data)
+        await asyncio.gather(*(
+            self._get_bookings(username) for username in self.auth_headers
+        ))
+    
+    async def _get_bookings(self, username):
+        try:
+            endpoint = self.urls["bookings"]
+            headers = self.auth_headers[username]
+            
+            logger.info(f"\nFetching bookings for: {username}")
+            async with self.session.get(endpoint, headers=headers) as response:
+                data = await response.json(loads=orjson.loads)
+            self.log_response(endpoint, "GET", response.status, data)
+            
+            if response.status == 200:
+                logger.info(f"✓ Retrieved {len(data)} bookings")
+            else:
+                logger.error("✗ Get bookings failed: %s", data.get("detail"))
                 
-                if response.status_code == 200:
-                    logger.info(f"✓ Retrieved {len(data)} bookings")
-                else:
-                    logger.error(f"✗ Get bookings failed: {data.get('detail')}")
-                    
-            except Exception as e:
-                logger.error(f"✗ Exception during get bookings: {type(e).__name__}: {str(e)}")
+        except Exception as e:
+            logger.error("✗ Exception during get bookings: %s: %s", type(e).__name__, e, exc_info=VERBOSE_ERRORS)
     
-    def test_get_conflicts(self):
+    async def test_get_conflicts(self):
         """Test fetching conflicts"""
-        logger.info("\n" + "="*60)
-        logger.info("TESTING: Get Conflicts")
-        logger.info("="*60)
+        log_banner("Get Conflicts")
+        if not self.tokens:
+            logger.warning("No tokens available, skipping %s", "Get Conflicts")
+            return
         
-        for username, token in self.tokens.items():
-            try:
-                endpoint = f"{self.base_url}/conflicts"
-                headers = {"Authorization": f"Bearer {token}"}
-                
-                logger.info(f"\nFetching conflicts for: {username}")
-                response = requests.get(endpoint, headers=headers)
-                data = response.json()
-                self.log_response(endpoint, "GET", response.status_code, data)
+        await asyncio.gather(*(
+            self._get_conflicts(username) for username in self.auth_headers
+        ))
+    
+    async def _get_conflicts(self, username):
+        try:
+            endpoint = self.urls["conflicts"]
+            headers = self.auth_headers[username]
+            
+            logger.info(f"\nFetching conflicts for: {username}")
+            async with self.session.get(endpoint, headers=headers) as response:
+                data = await response.json(loads=orjson.loads)
+            self.log_response(endpoint, "GET", response.status, data)
+            
+            if response.status == 200:
+                logger.info(f"✓ Retrieved {len(data)} conflicts")
+            else:
+                logger.error("✗ Get conflicts failed: %s", data.get("detail"))
                 
-                if response.status_code == 200:
-                    logger.info(f"✓ Retrieved {len(data)} conflicts")
-                else:
-                    logger.error(f"✗ Get conflicts failed: {data.get('detail')}")
-                    
-            except Exception as e:
-                logger.error(f"✗ Exception during get conflicts: {type(e).__name__}: {str(e)}")
+        except Exception as e:
+            logger.error("✗ Exception during get conflicts: %s: %s", type(e).__name__, e, exc_info=VERBOSE_ERRORS)
     
-    def test_get_timezones(self):
+    async def test_get_timezones(self):
         """Test fetching timezones"""
-        logger.info("\n" + "="*60)
-        logger.info("TESTING: Get Timezones")
-        logger.info("="*60)
+        log_banner("Get Timezones")
+        
+        if self.timezones:
+            logger.info(f"✓ Using {len(self.timezones)} cached timezones")
+            return
         
         try:
-            endpoint = f"{self.base_url}/timezones"
+            endpoint = self.urls["timezones"]
             
             logger.info("\nFetching available timezones...")
-            response = requests.get(endpoint)
-            data = response.json()
-            self.log_response(endpoint, "GET", response.status_code, {})
+            async with self.session.get(endpoint) as response:
+                data = await response.json(loads=orjson.loads)
+            self.log_response(endpoint, "GET", response.status, {})
             
-            if response.status_code == 200:
-                logger.info(f"✓ Retrieved {len(data)} timezones")
+            if response.status == 200:
+                self.timezones = data.get("timezones")
+                logger.info(f"✓ Retrieved {len(self.timezones)} timezones")
             else:
-                logger.error(f"✗ Get timezones failed")
+                logger.error("✗ Get timezones failed")
                 
         except Exception as e:
-            logger.error(f"✗ Exception during get timezones: {type(e).__name__}: {str(e)}")
+            logger.error("✗ Exception during get timezones: %s: %s", type(e).__name__, e, exc_info=VERBOSE_ERRORS)
     
-    def test_delete_bookings(self):
+    async def test_delete_bookings(self):
         """Test deleting bookings"""
-        logger.info("\n" + "="*60)
-        logger.info("TESTING: Delete Bookings")
-        logger.info("="*60)
+        log_banner("Delete Bookings")
+        if not self.bookings:
+            logger.warning("No bookings created, skipping %s", "Delete Bookings")
+            return
         
+        deletes = []
         for username, booking_id in self.bookings.items():
-            try:
-                if username not in self.tokens:
-                    logger.warning(f"No token for {username}, skipping...")
-                    continue
-                
-                endpoint = f"{self.base_url}/bookings/{booking_id}"
-                token = self.tokens[username]
-                headers = {"Authorization": f"Bearer {token}"}
-                
-                logger.info(f"\nDeleting booking {booking_id} for: {username}")
-                response = requests.delete(endpoint, headers=headers)
-                data = response.json()
-                self.log_response(endpoint, "DELETE", response.status_code, data)
+            if username not in self.auth_headers:
+                logger.warning(f"No token for {username}, skipping...")
+                continue
+            deletes.append(self._delete_booking(username, booking_id))
+        await asyncio.gather(*deletes)
+    
+    async def _delete_booking(self, username, booking_id):
+        try:
+            endpoint = self.url_booking.format(booking_id)
+            headers = self.auth_headers[username]
+            
+            logger.info(f"\nDeleting booking {booking_id} for: {username}")
+            async with self.session.delete(endpoint, headers=headers) as response:
+                data = await response.json(loads=orjson.loads)
+            self.log_response(endpoint, "DELETE", response.status, data)
+            
+            if response.status == 200:
+                logger.info(f"✓ Booking deleted successfully")
+            else:
+                logger.error("✗ Delete booking failed: %s", data.get("detail"))
                 
-                if response.status_code == 200:
-                    logger.info(f"✓ Booking deleted successfully")
-                else:
-                    logger.error(f"✗ Delete booking failed: {data.get('detail')}")
-                    
-            except Exception as e:
-                logger.error(f"✗ Exception during delete booking: {type(e).__name__}: {str(e)}")
+        except Exception as e:
+            logger.error("✗ Exception during delete booking: %s: %s", type(e).__name__, e, exc_info=VERBOSE_ERRORS)
     
-    def run_all_tests(self):
-        """Run all API tests"""
-        logger.info("\n\n" + "="*60)
+    async def run_all_tests(self):
+        """Run all API tests.
+
+        Phases that depend on each other (registration -> login -> bookings)
+        run in order; independent requests within a phase run concurrently
+        over one shared session.
+        """
+        logger.info("\n\n" + BANNER)
         logger.info("NOTCLUELY API COMPREHENSIVE TEST SUITE")
-        logger.info("="*60)
+        logger.info(BANNER)
+        
+        connector = aiohttp.TCPConnector(
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+            enable_cleanup_closed=True,
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=REQUEST_TIMEOUT,
+            json_serialize=orjson_dumps,
+        ) as self.session:
+            # Fail fast instead of paying a timeout in every phase
+            if not await self.check_health():
+                logger.error("Backend at %s is unreachable, aborting test suite", self.base_url)
+                return
+            if not (REUSE_TOKENS and await self.restore_cached_tokens()):
+                await self.test_registration()
+                await self.test_login()
+            await asyncio.gather(self.test_get_me(), self.test_get_timezones())
+            await self.test_create_bookings()
+            await asyncio.gather(self.test_get_bookings(), self.test_get_conflicts())
+            await self.test_delete_bookings()
         
-        self.test_registration()
-        self.test_login()
-        self.test_get_me()
-        self.test_get_timezones()
-        self.test_create_bookings()
-        self.test_get_bookings()
-        self.test_get_conflicts()
-        self.test_delete_bookings()
+        if REUSE_TOKENS:
+            save_cache(CACHE_FILE, self.base_url, tokens=self.tokens, timezones=self.timezones)
         
-        logger.info("\n\n" + "="*60)
+        logger.info("\n\n" + BANNER)
         logger.info("TEST SUITE COMPLETE")
-        logger.info("="*60 + "\n")
+        logger.info(BANNER + "\n")
 
 if __name__ == "__main__":
     tester = APITester(BASE_URL)
-    tester.run_all_tests()
+    asyncio.run(tester.run_all_tests())
@@ -7,40 +7,47 @@ sys.path.insert(0, '.')
 
 from server import (
     app, get_password_hash, verify_password, create_access_token,
-    get_db, init_db
+    connect_db
 )
 
-def test_auth():
-    """Test authentication functions"""
-    print("\n=== TESTING AUTHENTICATION ===\n")
-    
-    # Test 1: Password hashing
+EXPECTED_TABLES = ['users', 'bookings', 'conflicts']
+
+def check_hash():
+    """Hash once (bcrypt is slow) and verify against that single hash"""
     print("✓ Test 1: Password hashing")
     password = "TestPassword123!"
     hashed = get_password_hash(password)
-    assert verify_password(password, hashed), "Password verification failed"
+    verified = verify_password(password, hashed)
+    assert verified, "Password verification failed"
     print(f"  - Password hashed: {hashed[:20]}...")
-    print(f"  - Verification passed: {verify_password(password, hashed)}")
-    
-    # Test 2: JWT token creation
+    print(f"  - Verification passed: {verified}")
+
+def check_jwt():
     print("\n✓ Test 2: JWT token creation")
-    token = create_access_token({"sub": "test-user-id"})
+    token = create_access_token("test-user-id")
     print(f"  - Token: {token[:50]}...")
     assert token, "Token not created"
-    
-    # Test 3: Database initialization
+
+def check_schema(conn):
     print("\n✓ Test 3: Database initialization")
-    init_db()
-    conn = get_db()
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    tables = [row[0] for row in cursor.fetchall()]
-    conn.close()
-    
-    expected_tables = ['users', 'bookings', 'conflicts']
-    for table in expected_tables:
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    for table in EXPECTED_TABLES:
         assert table in tables, f"Table {table} not created"
         print(f"  - Table '{table}' exists ✓")
+
+def test_auth():
+    """Test authentication functions"""
+    print("\n=== TESTING AUTHENTICATION ===\n")
+    
+    # The schema is created when server is imported, so no init_db() here;
+    # every check shares one connection
+    conn = connect_db()
+    try:
+        check_hash()
+        check_jwt()
+        check_schema(conn)
+    finally:
+        conn.close()
     
     print("\n=== ALL TESTS PASSED ===\n")
     print("Backend is ready for deployment!")
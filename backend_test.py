@@ -5,34 +5,83 @@ Tests all endpoints including user registration, booking CRUD, conflicts, and ti
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
-import json
+import argparse
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 from datetime import datetime, timezone, timedelta
 import uuid
 
+logger = logging.getLogger(__name__)
+
+# Independent tests share the session's 16-connection pool across threads
+MAX_WORKERS = 8
+
+def make_session(pool_size=16):
+    """Create a keep-alive session so every test reuses pooled connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 class NotCluelyAPITester:
     def __init__(self, base_url="https://profilesched.preview.emergentagent.com"):
         self.base_url = base_url
         self.api_url = f"{base_url}/api"
-        self.tests_run = 0
-        self.tests_passed = 0
+        self.urls = {
+            name: f"{self.api_url}/{path}"
+            for name, path in [
+                ("health", ""),
+                ("timezones", "timezones"),
+                ("register", "users/register"),
+                ("users", "users"),
+                ("bookings", "bookings"),
+                ("conflicts", "conflicts"),
+            ]
+        }
+        self.url_user_by_fingerprint = self.urls["users"] + "/by-fingerprint/{}"
+        self.url_user_timezone = self.urls["users"] + "/{}/timezone"
+        self.url_user_conflicts = self.urls["conflicts"] + "/user/{}"
+        self.url_booking = self.urls["bookings"] + "/{}"
+        self.results = Counter()  # True -> passed, False -> failed
+        self._results_lock = threading.Lock()
         self.test_users = []
         self.test_bookings = []
+        self.session = make_session()
+        
+        # Per-run fixtures computed once: one fingerprint suffix for every
+        # registered user and a fixed slot tomorrow at 10 AM UTC
+        self._run_id = uuid.uuid4().hex[:8]
+        self._tomorrow_slot = (datetime.now(timezone.utc) + timedelta(days=1)).replace(
+            hour=10, minute=0, second=0, microsecond=0
+        )
+        self._tomorrow_iso = self._tomorrow_slot.isoformat()
+        self._tomorrow_end_iso = (self._tomorrow_slot + timedelta(hours=1)).isoformat()
 
     def log_test(self, name, success, details=""):
-        """Log test result"""
-        self.tests_run += 1
+        """Log test result (passes at INFO, failures with details at ERROR)"""
+        with self._results_lock:
+            self.results[bool(success)] += 1
         if success:
-            self.tests_passed += 1
-            print(f"✅ {name}")
+            logger.info("✅ %s", name)
         else:
-            print(f"❌ {name} - {details}")
+            logger.error("❌ %s - %s", name, details)
         return success
 
     def test_api_health(self):
         """Test basic API connectivity"""
         try:
-            response = requests.get(f"{self.api_url}/", timeout=10)
+            response = self.session.get(self.urls["health"], timeout=10)
             success = response.status_code == 200 and "NotCluely API" in response.text
             return self.log_test("API Health Check", success, f"Status: {response.status_code}")
         except Exception as e:
@@ -41,10 +90,10 @@ class NotCluelyAPITester:
     def test_timezone_endpoint(self):
         """Test timezone listing endpoint"""
         try:
-            response = requests.get(f"{self.api_url}/timezones", timeout=10)
+            response = self.session.get(self.urls["timezones"], timeout=10)
             success = response.status_code == 200
             if success:
-                data = response.json()
+                data = orjson.loads(response.content)
                 success = "timezones" in data and len(data["timezones"]) > 0
             return self.log_test("Timezone Endpoint", success, f"Status: {response.status_code}")
         except Exception as e:
@@ -53,18 +102,18 @@ class NotCluelyAPITester:
     def test_user_registration_normal(self):
         """Test normal user registration"""
         try:
-            fingerprint = f"test_fp_{uuid.uuid4().hex[:8]}"
+            fingerprint = f"test_fp_{self._run_id}"
             user_data = {
                 "name": "Test User",
                 "fingerprint": fingerprint,
                 "timezone": "America/New_York"
             }
             
-            response = requests.post(f"{self.api_url}/users/register", json=user_data, timeout=10)
+            response = self.session.post(self.urls["register"], json=user_data, timeout=10)
             success = response.status_code == 200
             
             if success:
-                user = response.json()
+                user = orjson.loads(response.content)
                 success = (user["name"] == "Test User" and 
                           user["fingerprint"] == fingerprint and
                           user["is_admin"] == False)
@@ -78,18 +127,18 @@ class NotCluelyAPITester:
     def test_user_registration_admin(self):
         """Test admin user registration (rutvik case-insensitive)"""
         try:
-            fingerprint = f"admin_fp_{uuid.uuid4().hex[:8]}"
+            fingerprint = f"admin_fp_{self._run_id}"
             user_data = {
                 "name": "RUTVIK",  # Test case-insensitive
                 "fingerprint": fingerprint,
                 "timezone": "America/Los_Angeles"
             }
             
-            response = requests.post(f"{self.api_url}/users/register", json=user_data, timeout=10)
+            response = self.session.post(self.urls["register"], json=user_data, timeout=10)
             success = response.status_code == 200
             
             if success:
-                user = response.json()
+                user = orjson.loads(response.content)
                 success = (user["name"] == "RUTVIK" and 
                           user["fingerprint"] == fingerprint and
                           user["is_admin"] == True)
@@ -107,11 +156,11 @@ class NotCluelyAPITester:
         
         try:
             user = self.test_users[0]
-            response = requests.get(f"{self.api_url}/users/by-fingerprint/{user['fingerprint']}", timeout=10)
+            response = self.session.get(self.url_user_by_fingerprint.format(user["fingerprint"]), timeout=10)
             success = response.status_code == 200
             
             if success:
-                fetched_user = response.json()
+                fetched_user = orjson.loads(response.content)
                 success = fetched_user["id"] == user["id"]
             
             return self.log_test("User Fingerprint Lookup", success, f"Status: {response.status_code}")
@@ -121,11 +170,11 @@ class NotCluelyAPITester:
     def test_get_all_users(self):
         """Test getting all users"""
         try:
-            response = requests.get(f"{self.api_url}/users", timeout=10)
+            response = self.session.get(self.urls["users"], timeout=10)
             success = response.status_code == 200
             
             if success:
-                users = response.json()
+                users = orjson.loads(response.content)
                 success = isinstance(users, list) and len(users) >= len(self.test_users)
             
             return self.log_test("Get All Users", success, f"Status: {response.status_code}")
@@ -141,27 +190,24 @@ class NotCluelyAPITester:
             user = self.test_users[0]
             
             # Create booking for tomorrow at 10 AM UTC
-            tomorrow = datetime.now(timezone.utc) + timedelta(days=1)
-            start_time = tomorrow.replace(hour=10, minute=0, second=0, microsecond=0)
-            end_time = start_time + timedelta(hours=1)
-            
             booking_data = {
                 "title": "Test Meeting",
-                "start_time": start_time.isoformat(),
-                "end_time": end_time.isoformat(),
+                "start_time": self._tomorrow_iso,
+                "end_time": self._tomorrow_end_iso,
                 "notes": "Test booking notes",
                 "user_timezone": user["timezone"]
             }
             
-            response = requests.post(
-                f"{self.api_url}/bookings?user_id={user['id']}", 
+            response = self.session.post(
+                self.urls["bookings"],
+                params={"user_id": user["id"]},
                 json=booking_data, 
                 timeout=10
             )
             success = response.status_code == 200
             
             if success:
-                booking = response.json()
+                booking = orjson.loads(response.content)
                 success = (booking["title"] == "Test Meeting" and 
                           booking["user_id"] == user["id"])
                 if success:
@@ -189,15 +235,16 @@ class NotCluelyAPITester:
                 "user_timezone": user["timezone"]
             }
             
-            response = requests.post(
-                f"{self.api_url}/bookings?user_id={user['id']}", 
+            response = self.session.post(
+                self.urls["bookings"],
+                params={"user_id": user["id"]},
                 json=booking_data, 
                 timeout=10
             )
             success = response.status_code == 200
             
             if success:
-                booking = response.json()
+                booking = orjson.loads(response.content)
                 success = booking["title"] == "Conflicting Meeting"
                 if success:
                     self.test_bookings.append(booking)
@@ -209,11 +256,11 @@ class NotCluelyAPITester:
     def test_get_bookings(self):
         """Test getting all bookings"""
         try:
-            response = requests.get(f"{self.api_url}/bookings", timeout=10)
+            response = self.session.get(self.urls["bookings"], timeout=10)
             success = response.status_code == 200
             
             if success:
-                bookings = response.json()
+                bookings = orjson.loads(response.content)
                 success = isinstance(bookings, list) and len(bookings) >= len(self.test_bookings)
             
             return self.log_test("Get All Bookings", success, f"Status: {response.status_code}")
@@ -223,11 +270,11 @@ class NotCluelyAPITester:
     def test_get_conflicts(self):
         """Test getting conflicts"""
         try:
-            response = requests.get(f"{self.api_url}/conflicts", timeout=10)
+            response = self.session.get(self.urls["conflicts"], timeout=10)
             success = response.status_code == 200
             
             if success:
-                conflicts = response.json()
+                conflicts = orjson.loads(response.content)
                 success = isinstance(conflicts, list)
                 # Should have at least one conflict from our conflicting booking test
                 if len(self.test_bookings) >= 2:
@@ -244,11 +291,11 @@ class NotCluelyAPITester:
         
         try:
             user = self.test_users[0]
-            response = requests.get(f"{self.api_url}/conflicts/user/{user['id']}", timeout=10)
+            response = self.session.get(self.url_user_conflicts.format(user["id"]), timeout=10)
             success = response.status_code == 200
             
             if success:
-                conflicts = response.json()
+                conflicts = orjson.loads(response.content)
                 success = isinstance(conflicts, list)
             
             return self.log_test("Get User Conflicts", success, f"Status: {response.status_code}")
@@ -264,14 +311,15 @@ class NotCluelyAPITester:
             user = self.test_users[0]
             new_timezone = "Europe/London"
             
-            response = requests.put(
-                f"{self.api_url}/users/{user['id']}/timezone?timezone={new_timezone}", 
+            response = self.session.put(
+                self.url_user_timezone.format(user["id"]),
+                params={"timezone": new_timezone},
                 timeout=10
             )
             success = response.status_code == 200
             
             if success:
-                result = response.json()
+                result = orjson.loads(response.content)
                 success = result.get("success") == True
             
             return self.log_test("Update User Timezone", success, f"Status: {response.status_code}")
@@ -287,14 +335,15 @@ class NotCluelyAPITester:
             booking = self.test_bookings[0]
             user = self.test_users[0]
             
-            response = requests.delete(
-                f"{self.api_url}/bookings/{booking['id']}?user_id={user['id']}", 
+            response = self.session.delete(
+                self.url_booking.format(booking["id"]),
+                params={"user_id": user["id"]},
                 timeout=10
             )
             success = response.status_code == 200
             
             if success:
-                result = response.json()
+                result = orjson.loads(response.content)
                 success = result.get("success") == True
             
             return self.log_test("Delete Booking (Owner)", success, f"Status: {response.status_code}")
@@ -313,57 +362,76 @@ class NotCluelyAPITester:
             if not admin_user:
                 return self.log_test("Delete Booking (Admin)", False, "No admin user available")
             
-            response = requests.delete(
-                f"{self.api_url}/bookings/{booking['id']}?user_id={admin_user['id']}", 
+            response = self.session.delete(
+                self.url_booking.format(booking["id"]),
+                params={"user_id": admin_user["id"]},
                 timeout=10
             )
             success = response.status_code == 200
             
             if success:
-                result = response.json()
+                result = orjson.loads(response.content)
                 success = result.get("success") == True
             
             return self.log_test("Delete Booking (Admin)", success, f"Status: {response.status_code}")
         except Exception as e:
             return self.log_test("Delete Booking (Admin)", False, str(e))
 
+    def run_concurrently(self, executor, *tests):
+        """Run independent tests in parallel and wait for all of them"""
+        return list(executor.map(lambda test: test(), tests))
+
     def run_all_tests(self):
-        """Run all backend tests"""
+        """Run all backend tests
+
+        Steps that depend on earlier state (registration order, the
+        first booking before the conflicting one) stay sequential; each
+        group of independent tests runs concurrently.
+        """
         print("🚀 Starting NotCluely Backend API Tests")
         print(f"📍 Testing against: {self.base_url}")
         print("=" * 60)
         
-        # Basic connectivity
-        self.test_api_health()
-        self.test_timezone_endpoint()
-        
-        # User management
-        self.test_user_registration_normal()
-        self.test_user_registration_admin()
-        self.test_user_fingerprint_lookup()
-        self.test_get_all_users()
-        
-        # Booking management
-        self.test_create_booking_no_conflict()
-        self.test_create_conflicting_booking()
-        self.test_get_bookings()
-        
-        # Conflict management
-        self.test_get_conflicts()
-        self.test_get_user_conflicts()
-        
-        # Updates and deletions
-        self.test_update_user_timezone()
-        self.test_delete_booking_owner()
-        self.test_delete_booking_admin()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Basic connectivity
+            self.run_concurrently(executor, self.test_api_health, self.test_timezone_endpoint)
+            
+            # User management (test_users[0] must be the normal user)
+            self.test_user_registration_normal()
+            self.test_user_registration_admin()
+            self.run_concurrently(executor, self.test_user_fingerprint_lookup, self.test_get_all_users)
+            
+            # Booking management
+            self.test_create_booking_no_conflict()
+            self.test_create_conflicting_booking()
+            
+            # Listings and conflict management
+            self.run_concurrently(
+                executor,
+                self.test_get_bookings,
+                self.test_get_conflicts,
+                self.test_get_user_conflicts,
+            )
+            
+            # Updates and deletions touch different rows
+            self.run_concurrently(
+                executor,
+                self.test_update_user_timezone,
+                self.test_delete_booking_owner,
+                self.test_delete_booking_admin,
+            )
         
         # Summary
-        print("=" * 60)
-        print(f"📊 Tests completed: {self.tests_passed}/{self.tests_run}")
-        success_rate = (self.tests_passed / self.tests_run * 100) if self.tests_run > 0 else 0
-        print(f"📈 Success rate: {success_rate:.1f}%")
+        tests_passed = self.results[True]
+        tests_run = tests_passed + self.results[False]
+        success_rate = (tests_passed / tests_run * 100) if tests_run > 0 else 0
+        print(
+            f"{'=' * 60}\n"
+            f"📊 Tests completed: {tests_passed}/{tests_run}\n"
+            f"📈 Success rate: {success_rate:.1f}%"
+        )
         
-        if self.tests_passed == self.tests_run:
+        if tests_passed == tests_run:
             print("🎉 All tests passed!")
             return 0
         else:
@@ -371,6 +439,11 @@ class NotCluelyAPITester:
             return 1
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quiet", action="store_true", help="only report failures and the summary")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format="%(message)s")
+    
     tester = NotCluelyAPITester()
     return tester.run_all_tests()
 